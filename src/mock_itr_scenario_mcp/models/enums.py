@@ -73,6 +73,9 @@ class ProgressValue(str, Enum):
     COMPLETE = "100" # 완료 (38,911건)
 
 
+# 에러 타입 -> 값 (enum value 속성 접근 대신 dict 조회로 사용)
+ERROR_TYPE_VALUES: dict[ErrorType, str] = {e: e.value for e in ErrorType}
+
 # 에러 타입별 기본 메시지 (샘플 데이터 기반 - 빈도순)
 ERROR_MESSAGES: dict[ErrorType, str] = {
     # Load 액션 에러 (샘플 데이터 기반)
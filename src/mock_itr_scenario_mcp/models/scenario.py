@@ -270,6 +270,10 @@ class ScenarioConfig(BaseModel):
         """딕셔너리로 변환"""
         return self.model_dump(by_alias=True, exclude_none=True)
     
+    def to_json(self) -> str:
+        """JSON 문자열로 변환 (to_dict와 동일한 구조, 중간 dict 생성 없이 직렬화)"""
+        return self.model_dump_json(by_alias=True, exclude_none=True)
+    
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ScenarioConfig":
         """딕셔너리에서 생성"""
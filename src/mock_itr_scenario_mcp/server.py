@@ -1,12 +1,18 @@
 """MCP Server for Mock ITR Scenario management."""
 
 import asyncio
+import functools
 import json
 import logging
 import os
+import sys
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import boto3
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -16,7 +22,12 @@ from mcp.types import (
     ResourceTemplate,
 )
 
-from .models.enums import BizType, CertType, ErrorType, ERROR_MESSAGES, ERROR_MESSAGES_ALT, ERROR_DEFAULT_ACTION, ActionType, CorpType, ProgressValue, ERROR_FREQUENCY, get_error_message
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성 (미설치시 표준 json 사용)
+    orjson = None  # type: ignore[assignment]
+
+from .models.enums import BizType, CertType, ErrorType, ERROR_MESSAGES, ERROR_TYPE_VALUES, ERROR_MESSAGES_ALT, ERROR_DEFAULT_ACTION, ActionType, CorpType, ProgressValue, ERROR_FREQUENCY, get_error_message
 from .models.scenario import (
     ScenarioConfig,
     UserInfo,
@@ -54,42 +65,143 @@ server = Server("mock-itr-scenario")
 
 # Template storage (loaded from local templates directory)
 TEMPLATES: dict[str, dict[str, Any]] = {}
+# 템플릿 파일 원문 (template_load 응답에 재직렬화 없이 그대로 사용)
+TEMPLATES_RAW: dict[str, str] = {}
+# 로드된 템플릿 ID 목록 (템플릿 미존재 응답에 재사용)
+_TEMPLATE_IDS_TUPLE: tuple[str, ...] = ()
+# templates 디렉토리 mtime (로드 시점 기준, 변경 감지용)
+_TEMPLATES_MTIME: float = 0.0
+# 템플릿 목록 응답 캐시: cache key -> (templates 디렉토리 mtime, 직렬화된 JSON)
+_TEMPLATE_LIST_CACHE: dict[str, tuple[float, str]] = {}
+# template_list 응답 객체 캐시: category -> (payload, [TextContent]) (템플릿 재로드시 초기화)
+_TEMPLATE_LIST_RESPONSES: dict[str, tuple[str, list[TextContent]]] = {}
+
+# DynamoDB 테이블 리소스 (최초 사용 시 생성 후 재사용)
+_DDB_TABLE: Any = None
+_DDB_TABLE_LOCK = threading.Lock()
+
+TEMPLATE_CATEGORIES = ("all", "normal", "error", "corp")
+# 카테고리별 템플릿 ID 목록 (로드 시점에 분류, 로드 순서 유지)
+_CATEGORY_INDEX: dict[str, list[str]] = {category: [] for category in TEMPLATE_CATEGORIES}
+# 템플릿 간 반복되는 enum 성격의 값 (키와 함께 intern 처리)
+_INTERNED_VALUE_KEYS = frozenset({"biz_type", "cert_type"})
+# 템플릿 파일 동시 로드 스레드 수
+TEMPLATE_LOAD_WORKERS = 8
+
+
+# 프로젝트 루트 디렉토리 찾기 (src/mock_itr_scenario_mcp/server.py 기준, import 시 한 번만 계산)
+# src/mock_itr_scenario_mcp/server.py -> 프로젝트 루트
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
+_TEMPLATES_DIR = _PROJECT_ROOT / "templates"
 
 
 def get_templates_directory() -> Path:
     """Get templates directory path (relative to project root)."""
-    # 프로젝트 루트 디렉토리 찾기 (src/mock_itr_scenario_mcp/server.py 기준)
-    current_file = Path(__file__)
-    # src/mock_itr_scenario_mcp/server.py -> 프로젝트 루트
-    project_root = current_file.parent.parent.parent
-    templates_dir = project_root / "templates"
-    return templates_dir
+    return _TEMPLATES_DIR
+
+
+def get_templates_mtime(templates_dir: Path) -> float:
+    """Get templates directory mtime (0.0 if not found)."""
+    try:
+        return templates_dir.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _intern_object_pairs(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    """JSON 객체 키를 intern 처리하여 템플릿 간 동일 키 문자열을 공유"""
+    result: dict[str, Any] = {}
+    for key, value in pairs:
+        key = sys.intern(key)
+        if key in _INTERNED_VALUE_KEYS and isinstance(value, str):
+            value = sys.intern(value)
+        result[key] = value
+    return result
+
+
+def _intern_values(obj: Any) -> Any:
+    """orjson 파싱 결과에서 _INTERNED_VALUE_KEYS 값을 intern 처리 (키는 orjson 키 캐시로 공유)"""
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if key in _INTERNED_VALUE_KEYS and isinstance(value, str):
+                obj[key] = sys.intern(value)
+            else:
+                _intern_values(value)
+    elif isinstance(obj, list):
+        for item in obj:
+            _intern_values(item)
+    return obj
 
 
-def load_templates() -> dict[str, dict[str, Any]]:
+def _load_json(data: bytes) -> Any:
+    """템플릿 JSON 파싱 (orjson 사용 가능시 orjson)"""
+    if orjson is not None:
+        return _intern_values(orjson.loads(data))
+    return json.loads(data, object_pairs_hook=_intern_object_pairs)
+
+
+def _read_template(entry: os.DirEntry[str]) -> tuple[str, dict[str, Any] | None, str]:
+    """Read and parse a single template file (None on failure)."""
+    template_id = entry.name[:-len(".json")]
+    try:
+        raw = Path(entry.path).read_bytes()
+        template_data = _load_json(raw)
+        logger.info(f"Loaded template: {template_id}")
+        return template_id, template_data, raw.decode("utf-8")
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse template {template_id}: {e}")
+    except Exception as e:
+        logger.error(f"Failed to load template {template_id}: {e}")
+    return template_id, None, ""
+
+
+def get_template_categories(template_id: str) -> tuple[str, ...]:
+    """템플릿 ID로 카테고리 분류 (ERR 포함시 error, 아니면 normal / CORP 포함시 corp)"""
+    categories = ["all", "error" if "ERR" in template_id else "normal"]
+    if "CORP" in template_id:
+        categories.append("corp")
+    return tuple(categories)
+
+
+def load_templates(force_reload: bool = False) -> dict[str, dict[str, Any]]:
     """Load templates from local templates directory."""
-    global TEMPLATES
-    if TEMPLATES:
+    global TEMPLATES, _TEMPLATES_MTIME, _TEMPLATE_IDS_TUPLE
+    if TEMPLATES and not force_reload:
         return TEMPLATES
     
+    TEMPLATES.clear()
+    TEMPLATES_RAW.clear()
+    _TEMPLATE_LIST_CACHE.clear()
+    _TEMPLATE_LIST_RESPONSES.clear()
+    _TEMPLATE_IDS_TUPLE = ()
+    for template_ids in _CATEGORY_INDEX.values():
+        template_ids.clear()
+    
     try:
         templates_dir = get_templates_directory()
+        _TEMPLATES_MTIME = get_templates_mtime(templates_dir)
         
         if not templates_dir.exists():
             logger.warning(f"Templates directory not found: {templates_dir}")
             logger.info("Templates directory will be created if needed. You can add template JSON files (TPL_*.json) to it.")
             return TEMPLATES
         
-        for template_file in templates_dir.glob("TPL_*.json"):
-            template_id = template_file.stem
-            try:
-                with open(template_file, "r", encoding="utf-8") as f:
-                    TEMPLATES[template_id] = json.load(f)
-                    logger.info(f"Loaded template: {template_id}")
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse template {template_id}: {e}")
-            except Exception as e:
-                logger.error(f"Failed to load template {template_id}: {e}")
+        with os.scandir(templates_dir) as it:
+            entries = [
+                entry for entry in it
+                if entry.name.startswith("TPL_") and entry.name.endswith(".json") and entry.is_file()
+            ]
+        
+        # 파일 I/O는 GIL을 해제하므로 스레드로 동시에 읽음 (결과 순서는 entries 순서 유지)
+        with ThreadPoolExecutor(max_workers=TEMPLATE_LOAD_WORKERS) as executor:
+            for template_id, template_data, raw in executor.map(_read_template, entries):
+                if template_data is not None:
+                    TEMPLATES[template_id] = template_data
+                    TEMPLATES_RAW[template_id] = raw
+                    for category in get_template_categories(template_id):
+                        _CATEGORY_INDEX[category].append(template_id)
+        
+        _TEMPLATE_IDS_TUPLE = tuple(TEMPLATES.keys())
         
         if not TEMPLATES:
             logger.info(f"No templates found in {templates_dir}. Add TPL_*.json files to use templates.")
@@ -100,6 +212,84 @@ def load_templates() -> dict[str, dict[str, Any]]:
     return TEMPLATES
 
 
+def get_ddb_table() -> Any:
+    """Get DynamoDB scenario table (created once and reused)."""
+    global _DDB_TABLE
+    if _DDB_TABLE is not None:
+        return _DDB_TABLE
+    
+    with _DDB_TABLE_LOCK:
+        if _DDB_TABLE is None:
+            endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL")
+            table_name = os.environ.get("SCENARIO_TABLE_NAME", "mock-itr-scenarios")
+            region = os.environ.get("AWS_REGION", "ap-northeast-2")
+            
+            if endpoint_url:
+                dynamodb = boto3.resource("dynamodb", endpoint_url=endpoint_url, region_name=region)
+            else:
+                dynamodb = boto3.resource("dynamodb", region_name=region)
+            
+            _DDB_TABLE = dynamodb.Table(table_name)
+    
+    return _DDB_TABLE
+
+
+def _dump(obj: Any) -> str:
+    """MCP 응답용 JSON 직렬화 (공백 없는 compact 포맷, orjson 사용 가능시 orjson)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson 미지원 값 (64비트 초과 정수 등)은 표준 json으로 처리
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _build_template_summaries(templates: dict[str, dict[str, Any]], category: str) -> list[dict[str, Any]]:
+    """카테고리별 템플릿 요약 목록 생성"""
+    result = []
+    for template_id in _CATEGORY_INDEX[category]:
+        template_data = templates[template_id]
+        
+        # 템플릿 요약 정보
+        refund_result = template_data.get("refund_result", {})
+        total_refund = refund_result.get("total_refund", 0)
+        biz_type = template_data.get("biz_type", "unknown")
+        description = template_data.get("description", "")
+        
+        result.append({
+            "template_id": template_id,
+            "description": description,
+            "total_refund": total_refund,
+            "biz_type": biz_type,
+        })
+    return result
+
+
+def get_template_list_payload(category: str = "all", include_count: bool = True) -> str:
+    """템플릿 목록 JSON 반환 (templates 디렉토리 mtime이 바뀌지 않았으면 캐시 사용)"""
+    # 알 수 없는 카테고리는 필터링 없이 전체 목록과 동일
+    if category not in TEMPLATE_CATEGORIES:
+        category = "all"
+    cache_key = category if include_count else f"resource:{category}"
+    
+    mtime = get_templates_mtime(get_templates_directory())
+    cached = _TEMPLATE_LIST_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    # 디렉토리가 변경되었으면 템플릿을 다시 로드 (캐시도 함께 초기화됨)
+    templates = load_templates(force_reload=mtime != _TEMPLATES_MTIME)
+    result = _build_template_summaries(templates, category)
+    if include_count:
+        payload = _dump({"templates": result, "count": len(result)})
+    else:
+        payload = _dump({"templates": result})
+    
+    _TEMPLATE_LIST_CACHE[cache_key] = (_TEMPLATES_MTIME, payload)
+    return payload
+
+
 # ============================================================================
 # Helper Functions for Request/Response Data
 # ============================================================================
@@ -459,439 +649,451 @@ def build_corp_load_calc_response(
     return response.model_dump(exclude_none=True)
 
 
+# ============================================================================
+# Precomputed Responses
+# ============================================================================
+
+# 문자열 값 -> enum 조회 테이블 (Enum 생성자 호출 및 ValueError 처리 회피)
+_ERROR_TYPE_BY_VALUE: dict[str, ErrorType] = {e.value: e for e in ErrorType}
+_BIZ_TYPE_BY_VALUE: dict[str, BizType] = {e.value: e for e in BizType}
+_ERROR_TYPE_VALUES: list[str] = [e.value for e in ErrorType]
+_BIZ_TYPE_VALUES: list[str] = [e.value for e in BizType]
+
+
+def _build_error_types_payload() -> str:
+    """error_types_list 응답 생성 (빈도순 정렬)"""
+    error_types = []
+    
+    for error_type in ErrorType:
+        default_action = ERROR_DEFAULT_ACTION.get(error_type, ActionType.LOAD)
+        alt_messages = ERROR_MESSAGES_ALT.get(error_type, [])
+        frequency = ERROR_FREQUENCY.get(error_type, 0)
+        error_types.append({
+            "type": error_type.value,
+            "message": get_error_message(error_type),
+            "alt_messages": alt_messages,
+            "default_action": default_action.value,
+            "frequency": frequency,  # 샘플 데이터 기반 빈도
+        })
+    
+    # 빈도순 정렬
+    error_types.sort(key=lambda x: x["frequency"], reverse=True)
+    
+    return _dump({"error_types": error_types})
+
+
+def _build_error_types_resource_payload() -> str:
+    """scenario://error-types 리소스 응답 생성"""
+    error_types = []
+    for error_type in ErrorType:
+        default_action = ERROR_DEFAULT_ACTION.get(error_type, ActionType.LOAD)
+        error_types.append({
+            "type": error_type.value,
+            "message": get_error_message(error_type),
+            "default_action": default_action.value,
+        })
+    return _dump({"error_types": error_types})
+
+
+# 에러 타입 목록은 enum/상수 테이블에서만 결정되므로 import 시 한 번만 직렬화
+# (기환급자 메시지는 import 시점의 MOCK_ITR_MODEL_YEAR 값을 사용)
+_ERROR_TYPES_PAYLOAD = _build_error_types_payload()
+_ERROR_TYPES_RESOURCE_PAYLOAD = _build_error_types_resource_payload()
+_ERROR_TYPES_RESPONSE = [TextContent(type="text", text=_ERROR_TYPES_PAYLOAD)]
+
+
 # ============================================================================
 # MCP Tools
 # ============================================================================
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="template_list",
-            description="사용 가능한 시나리오 템플릿 목록을 조회합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "템플릿 카테고리 (normal, error, corp, all)",
-                        "enum": ["normal", "error", "corp", "all"],
-                        "default": "all"
-                    }
+# 도구 목록은 고정값이므로 import 시 한 번만 생성
+_TOOLS_LIST: list[Tool] = [
+    Tool(
+        name="template_list",
+        description="사용 가능한 시나리오 템플릿 목록을 조회합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "category": {
+                    "type": "string",
+                    "description": "템플릿 카테고리 (normal, error, corp, all)",
+                    "enum": ["normal", "error", "corp", "all"],
+                    "default": "all"
                 }
             }
-        ),
-        Tool(
-            name="template_load",
-            description="특정 템플릿을 로드하여 상세 내용을 확인합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "template_id": {
-                        "type": "string",
-                        "description": "템플릿 ID (예: TPL_NORMAL_BIZ_HIGH)"
-                    }
+        }
+    ),
+    Tool(
+        name="template_load",
+        description="특정 템플릿을 로드하여 상세 내용을 확인합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "template_id": {
+                    "type": "string",
+                    "description": "템플릿 ID (예: TPL_NORMAL_BIZ_HIGH)"
+                }
+            },
+            "required": ["template_id"]
+        }
+    ),
+    Tool(
+        name="scenario_build_normal",
+        description="정상 환급 시나리오를 생성합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
                 },
-                "required": ["template_id"]
-            }
-        ),
-        Tool(
-            name="scenario_build_normal",
-            description="정상 환급 시나리오를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "total_refund": {
-                        "type": "integer",
-                        "description": "총 환급액 (원)"
-                    },
-                    "biz_type": {
-                        "type": "string",
-                        "description": "사업자 유형",
-                        "enum": ["individual_biz", "non_biz", "corp"],
-                        "default": "individual_biz"
-                    },
-                    "창중감_환급액": {
-                        "type": "integer",
-                        "description": "창업중소기업감면 환급액",
-                        "default": 0
-                    },
-                    "고용증대_환급액": {
-                        "type": "integer",
-                        "description": "고용증대 환급액",
-                        "default": 0
-                    },
-                    "사회보험료_환급액": {
-                        "type": "integer",
-                        "description": "사회보험료 환급액",
-                        "default": 0
-                    },
-                    "양도세_환급액": {
-                        "type": "integer",
-                        "description": "양도세 환급액",
-                        "default": 0
-                    }
+                "total_refund": {
+                    "type": "integer",
+                    "description": "총 환급액 (원)"
                 },
-                "required": ["total_refund"]
-            }
-        ),
-        Tool(
-            name="scenario_build_error",
-            description="에러 시나리오를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "error_type": {
-                        "type": "string",
-                        "description": "에러 타입",
-                        "enum": [e.value for e in ErrorType]
-                    },
-                    "error_msg": {
-                        "type": "string",
-                        "description": "에러 메시지 (미입력시 기본 메시지 사용)"
-                    },
-                    "action": {
-                        "type": "string",
-                        "description": "에러 발생 액션",
-                        "enum": ["cert_request", "cert_response", "check", "load"],
-                        "default": "load"
-                    }
+                "biz_type": {
+                    "type": "string",
+                    "description": "사업자 유형",
+                    "enum": _BIZ_TYPE_VALUES,
+                    "default": "individual_biz"
                 },
-                "required": ["error_type"]
-            }
-        ),
-        Tool(
-            name="scenario_build_progress",
-            description="진행률 전송을 포함한 시나리오를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "total_refund": {
-                        "type": "integer",
-                        "description": "총 환급액 (원)"
-                    },
-                    "queue_name": {
-                        "type": "string",
-                        "description": "SQS 큐 이름",
-                        "default": "refund-search.fifo"
-                    },
-                    "steps": {
-                        "type": "array",
-                        "description": "진행률 단계 목록",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "step_name": {"type": "string"},
-                                "progress": {"type": "string"},
-                                "delay_seconds": {"type": "number", "default": 0.5}
-                            },
-                            "required": ["step_name", "progress"]
-                        }
-                    }
+                "창중감_환급액": {
+                    "type": "integer",
+                    "description": "창업중소기업감면 환급액",
+                    "default": 0
                 },
-                "required": ["total_refund"]
-            }
-        ),
-        Tool(
-            name="scenario_validate",
-            description="시나리오 유효성을 검사합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "scenario": {
-                        "type": "object",
-                        "description": "검사할 시나리오 객체"
-                    }
+                "고용증대_환급액": {
+                    "type": "integer",
+                    "description": "고용증대 환급액",
+                    "default": 0
                 },
-                "required": ["scenario"]
-            }
-        ),
-        Tool(
-            name="scenario_assign",
-            description="시나리오를 특정 user_ern에 할당합니다 (DynamoDB에 저장).",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_ern": {
-                        "type": "string",
-                        "description": "사용자 ERN"
-                    },
-                    "scenario": {
+                "사회보험료_환급액": {
+                    "type": "integer",
+                    "description": "사회보험료 환급액",
+                    "default": 0
+                },
+                "양도세_환급액": {
+                    "type": "integer",
+                    "description": "양도세 환급액",
+                    "default": 0
+                }
+            },
+            "required": ["total_refund"]
+        }
+    ),
+    Tool(
+        name="scenario_build_error",
+        description="에러 시나리오를 생성합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "error_type": {
+                    "type": "string",
+                    "description": "에러 타입",
+                    "enum": _ERROR_TYPE_VALUES
+                },
+                "error_msg": {
+                    "type": "string",
+                    "description": "에러 메시지 (미입력시 기본 메시지 사용)"
+                },
+                "action": {
+                    "type": "string",
+                    "description": "에러 발생 액션",
+                    "enum": ["cert_request", "cert_response", "check", "load"],
+                    "default": "load"
+                }
+            },
+            "required": ["error_type"]
+        }
+    ),
+    Tool(
+        name="scenario_build_progress",
+        description="진행률 전송을 포함한 시나리오를 생성합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "total_refund": {
+                    "type": "integer",
+                    "description": "총 환급액 (원)"
+                },
+                "queue_name": {
+                    "type": "string",
+                    "description": "SQS 큐 이름",
+                    "default": "refund-search.fifo"
+                },
+                "steps": {
+                    "type": "array",
+                    "description": "진행률 단계 목록",
+                    "items": {
                         "type": "object",
-                        "description": "할당할 시나리오 객체"
-                    },
-                    "template_id": {
-                        "type": "string",
-                        "description": "사용할 템플릿 ID (scenario 미입력시)"
+                        "properties": {
+                            "step_name": {"type": "string"},
+                            "progress": {"type": "string"},
+                            "delay_seconds": {"type": "number", "default": 0.5}
+                        },
+                        "required": ["step_name", "progress"]
                     }
+                }
+            },
+            "required": ["total_refund"]
+        }
+    ),
+    Tool(
+        name="scenario_validate",
+        description="시나리오 유효성을 검사합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "scenario": {
+                    "type": "object",
+                    "description": "검사할 시나리오 객체"
+                }
+            },
+            "required": ["scenario"]
+        }
+    ),
+    Tool(
+        name="scenario_assign",
+        description="시나리오를 특정 user_ern에 할당합니다 (DynamoDB에 저장).",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_ern": {
+                    "type": "string",
+                    "description": "사용자 ERN"
                 },
-                "required": ["user_ern"]
-            }
-        ),
-        Tool(
-            name="scenario_unassign",
-            description="user_ern에서 시나리오 할당을 해제합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_ern": {
-                        "type": "string",
-                        "description": "사용자 ERN"
-                    }
+                "scenario": {
+                    "type": "object",
+                    "description": "할당할 시나리오 객체"
                 },
-                "required": ["user_ern"]
-            }
-        ),
-        Tool(
-            name="error_types_list",
-            description="지원하는 에러 타입 목록을 조회합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="scenario_build_simple_auth",
-            description="[개인] 간편인증 flow 시나리오를 생성합니다. (cert_request -> cert_response -> check -> load)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "phone": {
-                        "type": "string",
-                        "description": "전화번호",
-                        "default": "01012345678"
-                    },
-                    "birthday": {
-                        "type": "string",
-                        "description": "생년월일 (YYYYMMDD)",
-                        "default": "19900101"
-                    },
-                    "cert_type": {
-                        "type": "string",
-                        "description": "간편인증 유형",
-                        "enum": ["kakao", "naver"],
-                        "default": "kakao"
-                    },
-                    "total_refund": {
-                        "type": "integer",
-                        "description": "총 환급액 (원)"
-                    }
+                "template_id": {
+                    "type": "string",
+                    "description": "사용할 템플릿 ID (scenario 미입력시)"
+                }
+            },
+            "required": ["user_ern"]
+        }
+    ),
+    Tool(
+        name="scenario_unassign",
+        description="user_ern에서 시나리오 할당을 해제합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_ern": {
+                    "type": "string",
+                    "description": "사용자 ERN"
+                }
+            },
+            "required": ["user_ern"]
+        }
+    ),
+    Tool(
+        name="error_types_list",
+        description="지원하는 에러 타입 목록을 조회합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        }
+    ),
+    Tool(
+        name="scenario_build_simple_auth",
+        description="[개인] 간편인증 flow 시나리오를 생성합니다. (cert_request -> cert_response -> check -> load)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
                 },
-                "required": ["total_refund"]
-            }
-        ),
-        Tool(
-            name="scenario_build_common_cert",
-            description="[개인] 공동인증서 flow 시나리오를 생성합니다. (check -> load)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "total_refund": {
-                        "type": "integer",
-                        "description": "총 환급액 (원)"
-                    }
+                "phone": {
+                    "type": "string",
+                    "description": "전화번호",
+                    "default": "01012345678"
                 },
-                "required": ["total_refund"]
-            }
-        ),
-        Tool(
-            name="scenario_build_corp_common_cert",
-            description="[법인] 공동인증서 flow 시나리오를 생성합니다. (check -> corp_load_calc)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "biz_name": {
-                        "type": "string",
-                        "description": "사업체명",
-                        "default": "주식회사 테스트사업자"
-                    },
-                    "biz_no": {
-                        "type": "string",
-                        "description": "사업자번호",
-                        "default": "1234104321"
-                    },
-                    "ceo_name": {
-                        "type": "string",
-                        "description": "대표자명",
-                        "default": "테스트대표자"
-                    }
+                "birthday": {
+                    "type": "string",
+                    "description": "생년월일 (YYYYMMDD)",
+                    "default": "19900101"
+                },
+                "cert_type": {
+                    "type": "string",
+                    "description": "간편인증 유형",
+                    "enum": ["kakao", "naver"],
+                    "default": "kakao"
+                },
+                "total_refund": {
+                    "type": "integer",
+                    "description": "총 환급액 (원)"
+                }
+            },
+            "required": ["total_refund"]
+        }
+    ),
+    Tool(
+        name="scenario_build_common_cert",
+        description="[개인] 공동인증서 flow 시나리오를 생성합니다. (check -> load)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "total_refund": {
+                    "type": "integer",
+                    "description": "총 환급액 (원)"
+                }
+            },
+            "required": ["total_refund"]
+        }
+    ),
+    Tool(
+        name="scenario_build_corp_common_cert",
+        description="[법인] 공동인증서 flow 시나리오를 생성합니다. (check -> corp_load_calc)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "biz_name": {
+                    "type": "string",
+                    "description": "사업체명",
+                    "default": "주식회사 테스트사업자"
+                },
+                "biz_no": {
+                    "type": "string",
+                    "description": "사업자번호",
+                    "default": "1234104321"
+                },
+                "ceo_name": {
+                    "type": "string",
+                    "description": "대표자명",
+                    "default": "테스트대표자"
                 }
             }
-        ),
-        Tool(
-            name="scenario_build_simple_auth_fail",
-            description="카카오톡 간편인증 요청 실패 시나리오를 생성합니다.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "phone": {
-                        "type": "string",
-                        "description": "전화번호",
-                        "default": "01012345678"
-                    },
-                    "birthday": {
-                        "type": "string",
-                        "description": "생년월일 (YYYYMMDD)",
-                        "default": "19900101"
-                    },
-                    "cert_type": {
-                        "type": "string",
-                        "description": "간편인증 유형",
-                        "enum": ["kakao", "naver"],
-                        "default": "kakao"
-                    },
-                    "error_msg": {
-                        "type": "string",
-                        "description": "에러 메시지 (미입력시 기본 메시지 사용)",
-                        "default": ""
-                    }
+        }
+    ),
+    Tool(
+        name="scenario_build_simple_auth_fail",
+        description="카카오톡 간편인증 요청 실패 시나리오를 생성합니다.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "phone": {
+                    "type": "string",
+                    "description": "전화번호",
+                    "default": "01012345678"
+                },
+                "birthday": {
+                    "type": "string",
+                    "description": "생년월일 (YYYYMMDD)",
+                    "default": "19900101"
+                },
+                "cert_type": {
+                    "type": "string",
+                    "description": "간편인증 유형",
+                    "enum": ["kakao", "naver"],
+                    "default": "kakao"
+                },
+                "error_msg": {
+                    "type": "string",
+                    "description": "에러 메시지 (미입력시 기본 메시지 사용)",
+                    "default": ""
                 }
             }
-        ),
-        Tool(
-            name="scenario_build_cert_response_fail",
-            description="간편인증 완료 확인(cert_response) 실패 시나리오를 생성합니다. (cert_request 성공 후 cert_response 실패)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_name": {
-                        "type": "string",
-                        "description": "사용자 이름",
-                        "default": "테스트사용자"
-                    },
-                    "phone": {
-                        "type": "string",
-                        "description": "전화번호",
-                        "default": "01012345678"
-                    },
-                    "birthday": {
-                        "type": "string",
-                        "description": "생년월일 (YYYYMMDD)",
-                        "default": "19900101"
-                    },
-                    "cert_type": {
-                        "type": "string",
-                        "description": "간편인증 유형",
-                        "enum": ["kakao", "naver"],
-                        "default": "kakao"
-                    },
-                    "error_type": {
-                        "type": "string",
-                        "description": "에러 타입",
-                        "enum": ["간편인증토큰만료", "간편인증미완료", "간편인증오류"],
-                        "default": "간편인증미완료"
-                    },
-                    "error_msg": {
-                        "type": "string",
-                        "description": "에러 메시지 (미입력시 기본 메시지 사용)",
-                        "default": ""
-                    }
+        }
+    ),
+    Tool(
+        name="scenario_build_cert_response_fail",
+        description="간편인증 완료 확인(cert_response) 실패 시나리오를 생성합니다. (cert_request 성공 후 cert_response 실패)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_name": {
+                    "type": "string",
+                    "description": "사용자 이름",
+                    "default": "테스트사용자"
+                },
+                "phone": {
+                    "type": "string",
+                    "description": "전화번호",
+                    "default": "01012345678"
+                },
+                "birthday": {
+                    "type": "string",
+                    "description": "생년월일 (YYYYMMDD)",
+                    "default": "19900101"
+                },
+                "cert_type": {
+                    "type": "string",
+                    "description": "간편인증 유형",
+                    "enum": ["kakao", "naver"],
+                    "default": "kakao"
+                },
+                "error_type": {
+                    "type": "string",
+                    "description": "에러 타입",
+                    "enum": ["간편인증토큰만료", "간편인증미완료", "간편인증오류"],
+                    "default": "간편인증미완료"
+                },
+                "error_msg": {
+                    "type": "string",
+                    "description": "에러 메시지 (미입력시 기본 메시지 사용)",
+                    "default": ""
                 }
             }
-        ),
-    ]
+        }
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools."""
+    return _TOOLS_LIST
 
 
 @server.call_tool()
 async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
     """Handle tool calls."""
-    
-    if name == "template_list":
-        return await handle_template_list(arguments)
-    elif name == "template_load":
-        return await handle_template_load(arguments)
-    elif name == "scenario_build_normal":
-        return await handle_scenario_build_normal(arguments)
-    elif name == "scenario_build_error":
-        return await handle_scenario_build_error(arguments)
-    elif name == "scenario_build_progress":
-        return await handle_scenario_build_progress(arguments)
-    elif name == "scenario_validate":
-        return await handle_scenario_validate(arguments)
-    elif name == "scenario_assign":
-        return await handle_scenario_assign(arguments)
-    elif name == "scenario_unassign":
-        return await handle_scenario_unassign(arguments)
-    elif name == "error_types_list":
-        return await handle_error_types_list(arguments)
-    elif name == "scenario_build_simple_auth":
-        return await handle_scenario_build_simple_auth(arguments)
-    elif name == "scenario_build_common_cert":
-        return await handle_scenario_build_common_cert(arguments)
-    elif name == "scenario_build_corp_common_cert":
-        return await handle_scenario_build_corp_common_cert(arguments)
-    elif name == "scenario_build_simple_auth_fail":
-        return await handle_scenario_build_simple_auth_fail(arguments)
-    elif name == "scenario_build_cert_response_fail":
-        return await handle_scenario_build_cert_response_fail(arguments)
-    else:
+    handler = _TOOL_DISPATCH.get(name)
+    if handler is None:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
+    return await handler(arguments)
 
 
 async def handle_template_list(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle template_list tool."""
     category = arguments.get("category", "all")
-    templates = load_templates()
+    if category not in TEMPLATE_CATEGORIES:
+        category = "all"
+    payload = get_template_list_payload(category)
     
-    result = []
-    for template_id, template_data in templates.items():
-        # 카테고리 필터링
-        if category != "all":
-            if category == "normal" and "ERR" in template_id:
-                continue
-            if category == "error" and "ERR" not in template_id:
-                continue
-            if category == "corp" and "CORP" not in template_id:
-                continue
-        
-        # 템플릿 요약 정보
-        refund_result = template_data.get("refund_result", {})
-        total_refund = refund_result.get("total_refund", 0)
-        biz_type = template_data.get("biz_type", "unknown")
-        description = template_data.get("description", "")
-        
-        result.append({
-            "template_id": template_id,
-            "description": description,
-            "total_refund": total_refund,
-            "biz_type": biz_type,
-        })
+    # 같은 payload면 이전에 만든 TextContent 재사용 (payload가 다시 만들어지면 교체)
+    cached = _TEMPLATE_LIST_RESPONSES.get(category)
+    if cached is not None and cached[0] is payload:
+        return cached[1]
     
-    return [TextContent(
-        type="text",
-        text=json.dumps({"templates": result, "count": len(result)}, ensure_ascii=False, indent=2)
-    )]
+    response = [TextContent(type="text", text=payload)]
+    _TEMPLATE_LIST_RESPONSES[category] = (payload, response)
+    return response
 
 
 async def handle_template_load(arguments: dict[str, Any]) -> list[TextContent]:
@@ -900,19 +1102,18 @@ async def handle_template_load(arguments: dict[str, Any]) -> list[TextContent]:
     templates = load_templates()
     
     if template_id not in templates:
-        available = list(templates.keys())
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dump({
                 "error": f"Template not found: {template_id}",
-                "available_templates": available,
+                "available_templates": _TEMPLATE_IDS_TUPLE,
                 "note": f"Templates are loaded from: {get_templates_directory()}"
-            }, ensure_ascii=False, indent=2)
+            })
         )]
     
     return [TextContent(
         type="text",
-        text=json.dumps(templates[template_id], ensure_ascii=False, indent=2)
+        text=TEMPLATES_RAW[template_id]
     )]
 
 
@@ -922,7 +1123,15 @@ async def handle_scenario_build_normal(arguments: dict[str, Any]) -> list[TextCo
     total_refund = arguments.get("total_refund", 0)
     biz_type_str = arguments.get("biz_type", "individual_biz")
     
-    biz_type = BizType(biz_type_str)
+    biz_type = _BIZ_TYPE_BY_VALUE.get(biz_type_str)
+    if biz_type is None:
+        return [TextContent(
+            type="text",
+            text=_dump({
+                "error": f"Unknown biz type: {biz_type_str}",
+                "available_types": _BIZ_TYPE_VALUES
+            })
+        )]
     
     # 환급 항목
     창중감 = arguments.get("창중감_환급액", 0)
@@ -970,7 +1179,7 @@ async def handle_scenario_build_normal(arguments: dict[str, Any]) -> list[TextCo
         
         return [TextContent(
             type="text",
-            text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+            text=scenario.to_json()
         )]
     
     # 정상 환급 시나리오 생성
@@ -1021,10 +1230,35 @@ async def handle_scenario_build_normal(arguments: dict[str, Any]) -> list[TextCo
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=scenario.to_json()
     )]
 
 
+# 에러 발생 액션 -> (ScenarioConfig 설정 필드, 요청 데이터 생성, 응답 데이터 생성)
+_ERROR_ACTIONS: dict[str, tuple[str, Callable[[UserInfo], dict[str, Any]], Callable[..., dict[str, Any]]]] = {
+    ActionType.CERT_REQUEST.value: (
+        "cert_request_config",
+        lambda user_info: build_cert_request_data(user_info=user_info),
+        build_cert_request_response,
+    ),
+    ActionType.CERT_RESPONSE.value: (
+        "cert_response_config",
+        lambda user_info: build_cert_response_data(user_info=user_info, cert_info=CertInfo()),
+        build_cert_response_response,
+    ),
+    ActionType.CHECK.value: (
+        "check_config",
+        lambda user_info: build_check_request_data(),
+        build_check_response,
+    ),
+    ActionType.LOAD.value: (
+        "load_config",
+        lambda user_info: build_load_request_data(export_file_prefix=TaxpayerInfo().tin),
+        build_load_response,
+    ),
+}
+
+
 async def handle_scenario_build_error(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle scenario_build_error tool."""
     user_name = arguments.get("user_name", "테스트사용자")
@@ -1032,17 +1266,18 @@ async def handle_scenario_build_error(arguments: dict[str, Any]) -> list[TextCon
     error_msg = arguments.get("error_msg", "")
     action_str = arguments.get("action", "")
     
-    try:
-        error_type = ErrorType(error_type_str)
-    except ValueError:
+    error_type = _ERROR_TYPE_BY_VALUE.get(error_type_str)
+    if error_type is None:
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dump({
                 "error": f"Unknown error type: {error_type_str}",
-                "available_types": [e.value for e in ErrorType]
-            }, ensure_ascii=False, indent=2)
+                "available_types": _ERROR_TYPE_VALUES
+            })
         )]
     
+    error_type_value = ERROR_TYPE_VALUES[error_type]
+    
     # 기본 메시지 사용 (환경변수 고려)
     if not error_msg:
         error_msg = get_error_message(error_type)
@@ -1057,74 +1292,32 @@ async def handle_scenario_build_error(arguments: dict[str, Any]) -> list[TextCon
     
     # 시나리오 생성
     scenario = ScenarioConfig(
-        scenario_name=f"에러_{error_type.value}_{user_name}",
-        description=f"{user_name}의 {error_type.value} 에러 시나리오",
+        scenario_name=f"에러_{error_type_value}_{user_name}",
+        description=f"{user_name}의 {error_type_value} 에러 시나리오",
         user_info=user_info,
     )
     
-    # 해당 액션에 에러 설정 및 요청/응답 데이터 생성
-    if action_str == "cert_request":
-        request_data = build_cert_request_data(user_info=user_info)
-        response_data = build_cert_request_response(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-        )
-        scenario.cert_request_config = ActionConfig(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-            request_data=request_data,
-            response_data=response_data,
-        )
-    elif action_str == "cert_response":
-        cert_info = CertInfo()
-        request_data = build_cert_response_data(user_info=user_info, cert_info=cert_info)
-        response_data = build_cert_response_response(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-        )
-        scenario.cert_response_config = ActionConfig(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-            request_data=request_data,
-            response_data=response_data,
-        )
-    elif action_str == "check":
-        request_data = build_check_request_data()
-        response_data = build_check_response(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-        )
-        scenario.check_config = ActionConfig(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-            request_data=request_data,
-            response_data=response_data,
-        )
-    else:  # load
-        taxpayer_info = TaxpayerInfo()
-        request_data = build_load_request_data(export_file_prefix=taxpayer_info.tin)
-        response_data = build_load_response(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-        )
-        scenario.load_config = ActionConfig(
-            success=False,
-            error_type=error_type.value,
-            error_msg=error_msg,
-            request_data=request_data,
-            response_data=response_data,
-        )
+    # 해당 액션에 에러 설정 및 요청/응답 데이터 생성 (알 수 없는 액션은 load)
+    if isinstance(action_str, ActionType):
+        action_str = action_str.value
+    attr_name, build_request, build_response = _ERROR_ACTIONS.get(action_str, _ERROR_ACTIONS[ActionType.LOAD.value])
+    request_data = build_request(user_info)
+    response_data = build_response(
+        success=False,
+        error_type=error_type_value,
+        error_msg=error_msg,
+    )
+    setattr(scenario, attr_name, ActionConfig(
+        success=False,
+        error_type=error_type_value,
+        error_msg=error_msg,
+        request_data=request_data,
+        response_data=response_data,
+    ))
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=scenario.to_json()
     )]
 
 
@@ -1201,46 +1394,67 @@ async def handle_scenario_build_progress(arguments: dict[str, Any]) -> list[Text
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=scenario.to_json()
     )]
 
 
-async def handle_scenario_validate(arguments: dict[str, Any]) -> list[TextContent]:
-    """Handle scenario_validate tool."""
-    scenario_data = arguments.get("scenario", {})
-    
+def check_scenario(scenario: ScenarioConfig) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """파싱된 시나리오 추가 검증 (errors, warnings 반환)"""
     errors = []
     warnings = []
     
+    if scenario.biz_type == BizType.INDIVIDUAL_BIZ:
+        if scenario.refund_result.total_refund == 0:
+            warnings.append("개인사업자 시나리오인데 환급액이 0원입니다.")
+    
+    if scenario.user_info.phone and len(scenario.user_info.phone) != 11:
+        warnings.append("전화번호가 11자리가 아닙니다.")
+    
+    if scenario.user_info.birthday and len(scenario.user_info.birthday) != 8:
+        errors.append("생년월일은 YYYYMMDD 형식이어야 합니다.")
+    
+    if scenario.taxpayer_info.tin and len(scenario.taxpayer_info.tin) != 18:
+        errors.append("납세자관리번호는 18자리여야 합니다.")
+    
+    return tuple(errors), tuple(warnings)
+
+
+def validate_scenario(scenario_data: Any) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """시나리오 유효성 검사 (errors, warnings 반환)"""
     try:
         scenario = ScenarioConfig.from_dict(scenario_data)
-        
-        # 추가 검증
-        if scenario.biz_type == BizType.INDIVIDUAL_BIZ:
-            if scenario.refund_result.total_refund == 0:
-                warnings.append("개인사업자 시나리오인데 환급액이 0원입니다.")
-        
-        if scenario.user_info.phone and len(scenario.user_info.phone) != 11:
-            warnings.append("전화번호가 11자리가 아닙니다.")
-        
-        if scenario.user_info.birthday and len(scenario.user_info.birthday) != 8:
-            errors.append("생년월일은 YYYYMMDD 형식이어야 합니다.")
-        
-        if scenario.taxpayer_info.tin and len(scenario.taxpayer_info.tin) != 18:
-            errors.append("납세자관리번호는 18자리여야 합니다.")
-        
     except Exception as e:
-        errors.append(f"시나리오 파싱 오류: {str(e)}")
+        return (f"시나리오 파싱 오류: {str(e)}",), ()
+    return check_scenario(scenario)
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_cached(canonical_json: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """정규화된 시나리오 JSON 기준으로 검사 결과 캐시 (동일 시나리오 반복 검사용)"""
+    return validate_scenario(json.loads(canonical_json))
+
+
+async def handle_scenario_validate(arguments: dict[str, Any]) -> list[TextContent]:
+    """Handle scenario_validate tool."""
+    scenario_data = arguments.get("scenario", {})
+    
+    try:
+        canonical_json = json.dumps(scenario_data, sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError):
+        # JSON으로 정규화할 수 없는 입력은 캐시 없이 바로 검사
+        errors, warnings = validate_scenario(scenario_data)
+    else:
+        errors, warnings = _validate_cached(canonical_json)
     
     result = {
         "valid": len(errors) == 0,
-        "errors": errors,
-        "warnings": warnings,
+        "errors": list(errors),
+        "warnings": list(warnings),
     }
     
     return [TextContent(
         type="text",
-        text=json.dumps(result, ensure_ascii=False, indent=2)
+        text=_dump(result)
     )]
 
 
@@ -1253,7 +1467,7 @@ async def handle_scenario_assign(arguments: dict[str, Any]) -> list[TextContent]
     if not user_ern:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": "user_ern is required"}, ensure_ascii=False)
+            text=_dump({"error": "user_ern is required"})
         )]
     
     # 시나리오 결정
@@ -1264,33 +1478,22 @@ async def handle_scenario_assign(arguments: dict[str, Any]) -> list[TextContent]
         if template_id not in templates:
             return [TextContent(
                 type="text",
-                text=json.dumps({
+                text=_dump({
                     "error": f"Template not found: {template_id}",
-                    "available_templates": list(templates.keys()),
+                    "available_templates": _TEMPLATE_IDS_TUPLE,
                     "note": f"Templates are loaded from: {get_templates_directory()}"
-                }, ensure_ascii=False, indent=2)
+                })
             )]
         scenario = templates[template_id]
     else:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": "Either scenario or template_id is required"}, ensure_ascii=False)
+            text=_dump({"error": "Either scenario or template_id is required"})
         )]
     
     # DynamoDB 저장 시도
     try:
-        import boto3
-        
-        endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL")
-        table_name = os.environ.get("SCENARIO_TABLE_NAME", "mock-itr-scenarios")
-        region = os.environ.get("AWS_REGION", "ap-northeast-2")
-        
-        if endpoint_url:
-            dynamodb = boto3.resource("dynamodb", endpoint_url=endpoint_url, region_name=region)
-        else:
-            dynamodb = boto3.resource("dynamodb", region_name=region)
-        
-        table = dynamodb.Table(table_name)
+        table = get_ddb_table()
         
         item = {
             "user_ern": user_ern,
@@ -1301,24 +1504,24 @@ async def handle_scenario_assign(arguments: dict[str, Any]) -> list[TextContent]
         
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dump({
                 "success": True,
                 "user_ern": user_ern,
                 "message": f"시나리오가 {user_ern}에 할당되었습니다."
-            }, ensure_ascii=False, indent=2)
+            })
         )]
         
     except Exception as e:
         # DynamoDB 연결 실패시 JSON 출력
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dump({
                 "success": False,
                 "error": f"DynamoDB 저장 실패: {str(e)}",
                 "user_ern": user_ern,
                 "scenario": scenario,
                 "note": "DynamoDB에 저장하지 못했습니다. 위 시나리오를 수동으로 저장해주세요."
-            }, ensure_ascii=False, indent=2)
+            })
         )]
 
 
@@ -1329,67 +1532,36 @@ async def handle_scenario_unassign(arguments: dict[str, Any]) -> list[TextConten
     if not user_ern:
         return [TextContent(
             type="text",
-            text=json.dumps({"error": "user_ern is required"}, ensure_ascii=False)
+            text=_dump({"error": "user_ern is required"})
         )]
     
     try:
-        import boto3
-        
-        endpoint_url = os.environ.get("DYNAMODB_ENDPOINT_URL")
-        table_name = os.environ.get("SCENARIO_TABLE_NAME", "mock-itr-scenarios")
-        region = os.environ.get("AWS_REGION", "ap-northeast-2")
-        
-        if endpoint_url:
-            dynamodb = boto3.resource("dynamodb", endpoint_url=endpoint_url, region_name=region)
-        else:
-            dynamodb = boto3.resource("dynamodb", region_name=region)
-        
-        table = dynamodb.Table(table_name)
+        table = get_ddb_table()
         table.delete_item(Key={"user_ern": user_ern})
         
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dump({
                 "success": True,
                 "user_ern": user_ern,
                 "message": f"{user_ern}의 시나리오 할당이 해제되었습니다."
-            }, ensure_ascii=False, indent=2)
+            })
         )]
         
     except Exception as e:
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=_dump({
                 "success": False,
                 "error": f"DynamoDB 삭제 실패: {str(e)}",
                 "user_ern": user_ern,
-            }, ensure_ascii=False, indent=2)
+            })
         )]
 
 
 async def handle_error_types_list(arguments: dict[str, Any]) -> list[TextContent]:
     """Handle error_types_list tool."""
-    error_types = []
-    
-    for error_type in ErrorType:
-        default_action = ERROR_DEFAULT_ACTION.get(error_type, ActionType.LOAD)
-        alt_messages = ERROR_MESSAGES_ALT.get(error_type, [])
-        frequency = ERROR_FREQUENCY.get(error_type, 0)
-        error_types.append({
-            "type": error_type.value,
-            "message": get_error_message(error_type),
-            "alt_messages": alt_messages,
-            "default_action": default_action.value,
-            "frequency": frequency,  # 샘플 데이터 기반 빈도
-        })
-    
-    # 빈도순 정렬
-    error_types.sort(key=lambda x: x["frequency"], reverse=True)
-    
-    return [TextContent(
-        type="text",
-        text=json.dumps({"error_types": error_types}, ensure_ascii=False, indent=2)
-    )]
+    return _ERROR_TYPES_RESPONSE
 
 
 async def handle_scenario_build_simple_auth(arguments: dict[str, Any]) -> list[TextContent]:
@@ -1475,7 +1647,7 @@ async def handle_scenario_build_simple_auth(arguments: dict[str, Any]) -> list[T
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=scenario.to_json()
     )]
 
 
@@ -1534,7 +1706,7 @@ async def handle_scenario_build_common_cert(arguments: dict[str, Any]) -> list[T
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=scenario.to_json()
     )]
 
 
@@ -1600,7 +1772,7 @@ async def handle_scenario_build_corp_common_cert(arguments: dict[str, Any]) -> l
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=scenario.to_json()
     )]
 
 
@@ -1652,7 +1824,7 @@ async def handle_scenario_build_simple_auth_fail(arguments: dict[str, Any]) -> l
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=scenario.to_json()
     )]
 
 
@@ -1726,59 +1898,64 @@ async def handle_scenario_build_cert_response_fail(arguments: dict[str, Any]) ->
     
     return [TextContent(
         type="text",
-        text=json.dumps(scenario.to_dict(), ensure_ascii=False, indent=2)
+        text=scenario.to_json()
     )]
 
 
+# 도구 이름 -> 핸들러 (call_tool 디스패치용)
+_TOOL_DISPATCH: dict[str, Callable[[dict[str, Any]], Awaitable[list[TextContent]]]] = {
+    "template_list": handle_template_list,
+    "template_load": handle_template_load,
+    "scenario_build_normal": handle_scenario_build_normal,
+    "scenario_build_error": handle_scenario_build_error,
+    "scenario_build_progress": handle_scenario_build_progress,
+    "scenario_validate": handle_scenario_validate,
+    "scenario_assign": handle_scenario_assign,
+    "scenario_unassign": handle_scenario_unassign,
+    "error_types_list": handle_error_types_list,
+    "scenario_build_simple_auth": handle_scenario_build_simple_auth,
+    "scenario_build_common_cert": handle_scenario_build_common_cert,
+    "scenario_build_corp_common_cert": handle_scenario_build_corp_common_cert,
+    "scenario_build_simple_auth_fail": handle_scenario_build_simple_auth_fail,
+    "scenario_build_cert_response_fail": handle_scenario_build_cert_response_fail,
+}
+
+
 # ============================================================================
 # MCP Resources
 # ============================================================================
 
+# 리소스 목록은 고정값이므로 import 시 한 번만 생성
+_RESOURCES_LIST: list[Resource] = [
+    Resource(
+        uri="scenario://templates",
+        name="Templates",
+        description="사용 가능한 시나리오 템플릿 목록",
+        mimeType="application/json",
+    ),
+    Resource(
+        uri="scenario://error-types",
+        name="Error Types",
+        description="지원하는 에러 타입 목록",
+        mimeType="application/json",
+    ),
+]
+
+
 @server.list_resources()
 async def list_resources() -> list[Resource]:
     """List available resources."""
-    return [
-        Resource(
-            uri="scenario://templates",
-            name="Templates",
-            description="사용 가능한 시나리오 템플릿 목록",
-            mimeType="application/json",
-        ),
-        Resource(
-            uri="scenario://error-types",
-            name="Error Types",
-            description="지원하는 에러 타입 목록",
-            mimeType="application/json",
-        ),
-    ]
+    return _RESOURCES_LIST
 
 
 @server.read_resource()
 async def read_resource(uri: str) -> str:
     """Read a resource by URI."""
     if uri == "scenario://templates":
-        templates = load_templates()
-        result = []
-        for template_id, template_data in templates.items():
-            refund_result = template_data.get("refund_result", {})
-            result.append({
-                "template_id": template_id,
-                "description": template_data.get("description", ""),
-                "total_refund": refund_result.get("total_refund", 0),
-                "biz_type": template_data.get("biz_type", "unknown"),
-            })
-        return json.dumps({"templates": result}, ensure_ascii=False, indent=2)
+        return get_template_list_payload(include_count=False)
     
     elif uri == "scenario://error-types":
-        error_types = []
-        for error_type in ErrorType:
-            default_action = ERROR_DEFAULT_ACTION.get(error_type, ActionType.LOAD)
-            error_types.append({
-                "type": error_type.value,
-                "message": get_error_message(error_type),
-                "default_action": default_action.value,
-            })
-        return json.dumps({"error_types": error_types}, ensure_ascii=False, indent=2)
+        return _ERROR_TYPES_RESOURCE_PAYLOAD
     
     else:
         raise ValueError(f"Unknown resource URI: {uri}")
@@ -1790,6 +1967,18 @@ async def read_resource(uri: str) -> str:
 
 async def run_server():
     """Run the MCP server."""
+    logger.info("Starting mock-itr-scenario MCP server")
+    
+    # 첫 요청 전에 템플릿 캐시를 미리 로드
+    load_templates()
+    
+    # DynamoDB가 설정된 경우 테이블 리소스도 미리 생성
+    if os.environ.get("DYNAMODB_ENDPOINT_URL") or os.environ.get("SCENARIO_TABLE_NAME"):
+        try:
+            get_ddb_table()
+        except Exception as e:
+            logger.warning(f"Failed to initialize DynamoDB table: {e}")
+    
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
@@ -0,0 +1,127 @@
+"""Shared fixtures for tests."""
+
+import importlib
+import sys
+from collections.abc import Iterator
+from importlib.machinery import EXTENSION_SUFFIXES
+from typing import Any
+
+import pydantic
+import pytest
+
+# 모델 생성이 테스트 대부분을 차지하므로 컴파일된 pydantic-core(v2)에서만 실행
+# (v1에서는 pydantic_core / 패키지 import가 먼저 실패하므로 다른 import보다 앞서 확인)
+if int(pydantic.VERSION.split(".")[0]) < 2:
+    raise pytest.UsageError(f"pydantic v2 required (installed {pydantic.VERSION})")
+_core_ext = importlib.import_module("pydantic_core._pydantic_core")
+if not _core_ext.__file__ or not _core_ext.__file__.endswith(tuple(EXTENSION_SUFFIXES)):
+    raise pytest.UsageError(f"compiled pydantic-core required (loaded {_core_ext.__file__})")
+
+from mock_itr_scenario_mcp.models.enums import BizType, ErrorType, ERROR_MESSAGES  # noqa: E402
+from mock_itr_scenario_mcp.models.scenario import (  # noqa: E402
+    ScenarioConfig,
+    UserInfo,
+    RefundResult,
+    ActionConfig,
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _mock_loader_path() -> Iterator[None]:
+    """Set MOCK_ITR_LOADER_PATH for the test session only."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("MOCK_ITR_LOADER_PATH", "/tmp/mock-itrLoader")
+        yield
+
+
+# fixture 입력 문자열 상수
+_NAME_HONG = sys.intern("홍길동")
+_NAME_KIM = sys.intern("김철수")
+_NAME_TEST = sys.intern("테스트")
+_SCEN_CUSTOM = sys.intern("테스트 시나리오")
+_SCEN_DICT = sys.intern("딕셔너리 테스트")
+_SCEN_FROM_DICT = sys.intern("From Dict 테스트")
+_SCEN_NORMAL_REFUND = sys.intern("정상환급_테스트")
+_SCEN_ERR_NO_TAX_RETURN = sys.intern("에러_종소세신고내역없음")
+
+# enum 속성 조회는 import 시 한 번만 수행
+_NO_TAX_RETURN_VALUE = ErrorType.NO_TAX_RETURN.value
+_NO_TAX_RETURN_MSG = ERROR_MESSAGES[ErrorType.NO_TAX_RETURN]
+
+
+# 아래 fixture들은 모듈 단위로 한 번만 생성되므로 테스트에서 수정하지 않는다.
+# 수정이 필요한 테스트는 scope="function" fixture를 따로 사용할 것.
+# 입력이 확실히 유효한 fixture는 model_construct로 검증을 생략하고,
+# custom_scenario는 검증 경로를 지키기 위해 일반 생성자를 유지한다.
+
+@pytest.fixture(scope="module")
+def default_scenario() -> ScenarioConfig:
+    """Default ScenarioConfig."""
+    return ScenarioConfig.model_construct()
+
+
+@pytest.fixture(scope="module")
+def custom_scenario() -> ScenarioConfig:
+    """ScenarioConfig with custom user, biz type and refund."""
+    return ScenarioConfig(
+        scenario_name=_SCEN_CUSTOM,
+        user_info=UserInfo(name=_NAME_HONG),
+        biz_type=BizType.NON_BIZ,
+        refund_result=RefundResult(total_refund=1000000),
+    )
+
+
+@pytest.fixture(scope="module")
+def dict_payload() -> dict[str, Any]:
+    """Scenario dict payload for ScenarioConfig.from_dict()."""
+    return {
+        "scenario_name": _SCEN_FROM_DICT,
+        "user_info": {"name": _NAME_KIM},
+        "refund_result": {"total_refund": 750000},
+    }
+
+
+@pytest.fixture(scope="module")
+def serialized_scenario() -> tuple[ScenarioConfig, dict[str, Any]]:
+    """ScenarioConfig and its to_dict() result, serialized once per module."""
+    scenario = ScenarioConfig(
+        scenario_name=_SCEN_DICT,
+        refund_result=RefundResult(total_refund=500000),
+    )
+    return scenario, scenario.to_dict()
+
+
+@pytest.fixture(scope="module")
+def deserialized_scenario(dict_payload) -> ScenarioConfig:
+    """ScenarioConfig parsed from dict_payload once per module."""
+    return ScenarioConfig.from_dict(dict_payload)
+
+
+@pytest.fixture(scope="module")
+def normal_refund_scenario() -> ScenarioConfig:
+    """Normal refund scenario."""
+    return ScenarioConfig.model_construct(
+        scenario_name=_SCEN_NORMAL_REFUND,
+        user_info=UserInfo.model_construct(name=_NAME_TEST),
+        biz_type=BizType.INDIVIDUAL_BIZ,
+        refund_result=RefundResult.model_construct(
+            total_refund=3000000,
+            창중감_환급액=1000000,
+            고용증대_환급액=1500000,
+            사회보험료_환급액=500000,
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def error_scenario() -> ScenarioConfig:
+    """Error scenario failing on load."""
+    return ScenarioConfig.model_construct(
+        scenario_name=_SCEN_ERR_NO_TAX_RETURN,
+        user_info=UserInfo.model_construct(name=_NAME_TEST),
+        load_config=ActionConfig.model_construct(
+            success=False,
+            error_type=_NO_TAX_RETURN_VALUE,
+            error_msg=_NO_TAX_RETURN_MSG,
+        ),
+    )
@@ -1,129 +1,211 @@
 """Tests for MCP server."""
 
 import json
-import pytest
-from unittest.mock import patch, MagicMock
-
-# Set mock path before importing server
 import os
-os.environ["MOCK_ITR_LOADER_PATH"] = "/tmp/mock-itrLoader"
+import sys
+from operator import attrgetter
+
+import pytest
 
 from mock_itr_scenario_mcp.models.enums import BizType, ErrorType, ERROR_MESSAGES
-from mock_itr_scenario_mcp.models.scenario import (
-    ScenarioConfig,
-    UserInfo,
-    RefundResult,
-    ActionConfig,
-)
+from mock_itr_scenario_mcp.models.scenario import ScenarioConfig, RefundResult
+from mock_itr_scenario_mcp import server
+
+
+# 테스트 전반에서 재사용하는 문자열 상수
+_NAME_DEFAULT = sys.intern("테스트사용자")
+_NAME_HONG = sys.intern("홍길동")
+_NAME_KIM = sys.intern("김철수")
+_SCEN_CUSTOM = sys.intern("테스트 시나리오")
+_SCEN_DICT = sys.intern("딕셔너리 테스트")
+_SCEN_JSON = sys.intern("JSON 테스트")
+_SCEN_FROM_DICT = sys.intern("From Dict 테스트")
+_ERR_NO_TAX_RETURN = sys.intern("종소세신고내역없음")
 
 
 class TestModels:
     """Test Pydantic models."""
     
-    def test_scenario_config_default(self):
-        """Test default ScenarioConfig creation."""
-        scenario = ScenarioConfig()
+    @pytest.mark.parametrize("fixture_name, expected", [
+        ("default_scenario", {
+            "user_info.name": _NAME_DEFAULT,
+            "biz_type": BizType.INDIVIDUAL_BIZ,
+            "refund_result.total_refund": 0,
+        }),
+        ("custom_scenario", {
+            "scenario_name": _SCEN_CUSTOM,
+            "user_info.name": _NAME_HONG,
+            "biz_type": BizType.NON_BIZ,
+            "refund_result.total_refund": 1000000,
+        }),
+    ], ids=["default", "custom"])
+    def test_scenario_config(self, request, fixture_name, expected):
+        """Test default / custom ScenarioConfig creation."""
+        scenario = request.getfixturevalue(fixture_name)
         
-        assert scenario.user_info.name == "테스트사용자"
-        assert scenario.biz_type == BizType.INDIVIDUAL_BIZ
-        assert scenario.refund_result.total_refund == 0
+        assert {path: attrgetter(path)(scenario) for path in expected} == expected
     
-    def test_scenario_config_custom(self):
-        """Test custom ScenarioConfig creation."""
-        scenario = ScenarioConfig(
-            scenario_name="테스트 시나리오",
-            user_info=UserInfo(name="홍길동"),
-            biz_type=BizType.NON_BIZ,
-            refund_result=RefundResult(total_refund=1000000),
-        )
+    def test_scenario_to_dict(self, serialized_scenario):
+        """Test ScenarioConfig.to_dict()."""
+        scenario, data = serialized_scenario
         
-        assert scenario.scenario_name == "테스트 시나리오"
-        assert scenario.user_info.name == "홍길동"
-        assert scenario.biz_type == BizType.NON_BIZ
-        assert scenario.refund_result.total_refund == 1000000
+        assert data["scenario_name"] == _SCEN_DICT
+        assert data["refund_result"]["total_refund"] == 500000
+        assert data == scenario.model_dump(by_alias=True, exclude_none=True)
     
-    def test_scenario_to_dict(self):
-        """Test ScenarioConfig.to_dict()."""
+    def test_scenario_to_json(self):
+        """Test ScenarioConfig.to_json() matches to_dict()."""
         scenario = ScenarioConfig(
-            scenario_name="딕셔너리 테스트",
-            refund_result=RefundResult(total_refund=500000),
+            scenario_name=_SCEN_JSON,
+            refund_result=RefundResult(total_refund=500000, 양도세_환급액=1000),
         )
         
-        data = scenario.to_dict()
-        
-        assert data["scenario_name"] == "딕셔너리 테스트"
-        assert data["refund_result"]["total_refund"] == 500000
+        assert json.loads(scenario.to_json()) == scenario.to_dict()
     
-    def test_scenario_from_dict(self):
+    def test_scenario_from_dict(self, dict_payload, deserialized_scenario):
         """Test ScenarioConfig.from_dict()."""
-        data = {
-            "scenario_name": "From Dict 테스트",
-            "user_info": {"name": "김철수"},
-            "refund_result": {"total_refund": 750000},
-        }
-        
-        scenario = ScenarioConfig.from_dict(data)
+        scenario = deserialized_scenario
         
-        assert scenario.scenario_name == "From Dict 테스트"
-        assert scenario.user_info.name == "김철수"
+        assert scenario.scenario_name == _SCEN_FROM_DICT
+        assert scenario.user_info.name == _NAME_KIM
         assert scenario.refund_result.total_refund == 750000
+        assert scenario == ScenarioConfig.model_validate(dict_payload)
 
 
 class TestEnums:
     """Test enum definitions."""
     
-    def test_biz_type_values(self):
-        """Test BizType enum values."""
-        assert BizType.INDIVIDUAL_BIZ.value == "individual_biz"
-        assert BizType.NON_BIZ.value == "non_biz"
-        assert BizType.CORP.value == "corp"
+    @pytest.mark.parametrize("enum_member, expected", [
+        (BizType.INDIVIDUAL_BIZ, "individual_biz"),
+        (BizType.NON_BIZ, "non_biz"),
+        (BizType.CORP, "corp"),
+        (ErrorType.NO_TAX_RETURN, "종소세신고내역없음"),
+        (ErrorType.NO_BIZ, "사업자없음오류"),
+    ])
+    def test_enum_value(self, enum_member, expected):
+        """Test BizType / ErrorType enum values."""
+        assert enum_member.value == expected
     
-    def test_error_type_values(self):
-        """Test ErrorType enum values."""
-        assert ErrorType.NO_TAX_RETURN.value == "종소세신고내역없음"
-        assert ErrorType.NO_BIZ.value == "사업자없음오류"
-    
-    def test_error_messages(self):
+    @pytest.mark.parametrize("error_type, expected", [
+        (ErrorType.NO_TAX_RETURN, "종합소득세 신고 내역이 없습니다."),
+        (ErrorType.NO_BIZ, "처리중 예외가 발생하였습니다. [ 사업자 변경대상이 아님 ]"),
+    ])
+    def test_error_messages(self, error_type, expected):
         """Test error messages mapping."""
-        assert ERROR_MESSAGES[ErrorType.NO_TAX_RETURN] == "종합소득세 신고 내역이 없습니다."
-        assert ERROR_MESSAGES[ErrorType.NO_BIZ] == "사업자 등록 정보가 없습니다."
+        assert ERROR_MESSAGES[error_type] == expected
 
 
 class TestScenarioBuilder:
     """Test scenario building functions."""
     
-    def test_build_normal_scenario(self):
+    def test_build_normal_scenario(self, normal_refund_scenario):
         """Test building a normal refund scenario."""
-        scenario = ScenarioConfig(
-            scenario_name="정상환급_테스트",
-            user_info=UserInfo(name="테스트"),
-            biz_type=BizType.INDIVIDUAL_BIZ,
-            refund_result=RefundResult(
-                total_refund=3000000,
-                창중감_환급액=1000000,
-                고용증대_환급액=1500000,
-                사회보험료_환급액=500000,
-            ),
-        )
-        
-        assert scenario.refund_result.total_refund == 3000000
-        assert scenario.load_config.success == True
+        assert normal_refund_scenario.refund_result.total_refund == 3000000
+        assert normal_refund_scenario.load_config.success
     
-    def test_build_error_scenario(self):
+    def test_build_error_scenario(self, error_scenario):
         """Test building an error scenario."""
-        scenario = ScenarioConfig(
-            scenario_name="에러_종소세신고내역없음",
-            user_info=UserInfo(name="테스트"),
-            load_config=ActionConfig(
-                success=False,
-                error_type=ErrorType.NO_TAX_RETURN.value,
-                error_msg=ERROR_MESSAGES[ErrorType.NO_TAX_RETURN],
-            ),
+        assert not error_scenario.load_config.success
+        assert error_scenario.load_config.error_type == _ERR_NO_TAX_RETURN
+
+
+class TestToolDispatch:
+    """Test call_tool dispatch table."""
+    
+    def test_every_tool_has_handler(self):
+        """Test each listed tool is registered in the dispatch table."""
+        assert {tool.name for tool in server._TOOLS_LIST} == set(server._TOOL_DISPATCH)
+    
+    async def test_unknown_tool(self):
+        """Test unknown tool names return a text response."""
+        result = await server.call_tool("no_such_tool", {})
+        assert result[0].text == "Unknown tool: no_such_tool"
+
+
+class TestScenarioValidate:
+    """Test scenario_validate tool."""
+    
+    async def test_validate_repeated_scenario_cached(self):
+        """Test identical scenarios are validated once."""
+        server._validate_cached.cache_clear()
+        arguments = {"scenario": {"user_info": {"birthday": "1990"}}}
+        
+        first = json.loads((await server.handle_scenario_validate(arguments))[0].text)
+        second = json.loads((await server.handle_scenario_validate(arguments))[0].text)
+        
+        assert first == second
+        assert not first["valid"]
+        assert server._validate_cached.cache_info().hits == 1
+    
+    @pytest.mark.parametrize("scenario, expected", [
+        ({"user_info": "x"}, "Input should be a valid dictionary or instance of UserInfo"),
+        ({"refund_result": {"refund_items": {"a": 1}}}, "Input should be a valid list"),
+    ])
+    async def test_validate_error_text(self, scenario, expected):
+        """Test cached validation keeps the dict-path error text."""
+        server._validate_cached.cache_clear()
+        result = json.loads((await server.handle_scenario_validate({"scenario": scenario}))[0].text)
+        
+        assert expected in result["errors"][0]
+
+
+class TestTemplateList:
+    """Test template listing cache."""
+    
+    @pytest.fixture
+    def templates_dir(self, tmp_path, monkeypatch):
+        """Point the server at an isolated templates directory."""
+        (tmp_path / "TPL_NORMAL_A.json").write_text(
+            json.dumps({"description": "A", "refund_result": {"total_refund": 100}}),
+            encoding="utf-8",
         )
+        monkeypatch.setattr(server, "get_templates_directory", lambda: tmp_path)
+        server.load_templates(force_reload=True)
+        yield tmp_path
+        monkeypatch.undo()
+        server.load_templates(force_reload=True)
+    
+    def test_template_categories(self):
+        """Test template ID classification."""
+        assert server.get_template_categories("TPL_NORMAL_BIZ_HIGH") == ("all", "normal")
+        assert server.get_template_categories("TPL_CORP_ERR_NO_TAX_RETURN") == ("all", "error", "corp")
+    
+    def test_template_enum_values_interned(self):
+        """Test repeated enum-like template values share one string object."""
+        raw = b'{"biz_type": "individual_biz", "steps": [{"cert_type": "kakao_cert"}]}'
+        first, second = server._load_json(raw), server._load_json(raw)
+        
+        assert first["biz_type"] is second["biz_type"]
+        assert first["steps"][0]["cert_type"] is second["steps"][0]["cert_type"]
+    
+    def test_template_list_cached(self, templates_dir):
+        """Test repeated listing returns the cached payload."""
+        first = server.get_template_list_payload("all")
+        assert json.loads(first)["count"] == 1
+        assert server.get_template_list_payload("all") is first
+    
+    def test_template_list_reloads_on_mtime_change(self, templates_dir):
+        """Test listing is rebuilt when the templates directory changes."""
+        server.get_template_list_payload("all")
+        (templates_dir / "TPL_ERR_B.json").write_text("{}", encoding="utf-8")
+        os.utime(templates_dir, (0, server._TEMPLATES_MTIME + 10))
         
-        assert scenario.load_config.success == False
-        assert scenario.load_config.error_type == "종소세신고내역없음"
+        data = json.loads(server.get_template_list_payload("all"))
+        assert data["count"] == 2
+        assert json.loads(server.get_template_list_payload("error"))["count"] == 1
+
 
+class TestDynamoDB:
+    """Test DynamoDB table caching."""
+    
+    def test_ddb_table_reused(self, monkeypatch):
+        """Test the table resource is built once and reused."""
+        monkeypatch.setattr(server, "_DDB_TABLE", None)
+        monkeypatch.setenv("DYNAMODB_ENDPOINT_URL", "http://localhost:8000")
+        monkeypatch.setenv("SCENARIO_TABLE_NAME", "test-scenarios")
+        
+        table = server.get_ddb_table()
+        
+        assert table.name == "test-scenarios"
+        assert server.get_ddb_table() is table
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])